@@ -0,0 +1,15 @@
+"""
+Compila solo el núcleo opcional en Cython (no instala el simulador):
+python build_core.py build_ext --inplace
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name="turing_core",
+    ext_modules=cythonize(
+        Extension("turing_core", ["turing_core.pyx"],
+                  extra_compile_args=["-O3", "-march=native"]),
+        language_level=3,
+    ),
+)
@@ -0,0 +1,175 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Núcleo compilado (Cython) del bucle de run() de la MT.
+Compilar con: python build_core.py build_ext --inplace
+La cinta usa las mismas dos pilas que Tape, con su tope explícito.
+"""
+from cython.view cimport array as cvarray
+
+# Mismos códigos de resultado que _ACCEPT/_REJECT/_LOOP/_GROW en turing_simulator
+cdef enum:
+    ACCEPT = 0
+    REJECT = 1
+    LOOP = 2
+    GROW = 3
+
+
+cdef unsigned char[::1] _resized(unsigned char[::1] old, Py_ssize_t used):
+    cdef unsigned char[::1] new = bytearray(2 * old.shape[0])
+    new[:used] = old[:used]
+    return new
+
+
+cdef inline Py_ssize_t _edge(unsigned char[::1] stack, Py_ssize_t top, int blank) noexcept nogil:
+    """Índice del fondo de `stack[:top]` tras saltar los blanks del extremo."""
+    cdef Py_ssize_t lo = 0
+    while lo < top and stack[lo] == blank:
+        lo += 1
+    return lo
+
+
+cdef inline bint _same_stack(unsigned char[::1] stack, Py_ssize_t top,
+                             unsigned char[::1] saved, Py_ssize_t saved_len,
+                             int blank) noexcept nogil:
+    cdef Py_ssize_t lo = _edge(stack, top, blank), i
+    if top - lo != saved_len:
+        return False
+    for i in range(saved_len):
+        if stack[lo + i] != saved[i]:
+            return False
+    return True
+
+
+cdef class TuringMachineC:
+    """
+    Tablas int8[estados, símbolos] (next_state -1 = sin transición) construidas
+    a partir de TransitionFunction.table, el estado de parada por estado
+    (TuringMachine._status: 0 seguir, 1 aceptar, 2 rechazar) y el estado de la
+    ejecución en curso, incluida la configuración guardada por la detección
+    de ciclos de Brent (pilas sin los blanks del extremo en saved_left/
+    saved_right, con la capacidad de left/right).
+    """
+    cdef signed char[:, ::1] next_state, write_sym, move
+    cdef const unsigned char[::1] status
+    cdef unsigned char[::1] left, right, saved_left, saved_right
+    cdef int saved_state, saved_current
+    cdef long saved_head, next_save
+    cdef Py_ssize_t saved_left_len, saved_right_len
+    cdef public int state, current, blank
+    cdef public long head, steps
+    cdef public Py_ssize_t left_top, right_top
+
+    def __init__(self, table, status, int blank=0):
+        cdef Py_ssize_t num_states = len(table), num_symbols = len(table[0])
+        shape = (num_states, num_symbols)
+        self.next_state = cvarray(shape=shape, itemsize=1, format='b')
+        self.write_sym = cvarray(shape=shape, itemsize=1, format='b')
+        self.move = cvarray(shape=shape, itemsize=1, format='b')
+        self.next_state[:, :] = -1
+        self.write_sym[:, :] = 0
+        self.move[:, :] = 0
+        for state, row in enumerate(table):
+            for sym, trans in enumerate(row):
+                if trans is not None:
+                    self.next_state[state, sym] = trans[0]
+                    self.write_sym[state, sym] = trans[1]
+                    self.move[state, sym] = trans[2]
+        self.status = bytes(status)
+        self.blank = blank
+
+    def load(self, left, right, int current, long head, int state):
+        """Copia las pilas de una Tape (con holgura) y reinicia el contador de pasos."""
+        buf = bytearray(max(2 * len(left), 64))
+        buf[:len(left)] = left
+        self.left = buf
+        buf = bytearray(max(2 * len(right), 64))
+        buf[:len(right)] = right
+        self.right = buf
+        self.left_top, self.right_top = len(left), len(right)
+        self.current, self.head, self.state = current, head, state
+        self.steps = 0
+        self.saved_left = bytearray(self.left.shape[0])
+        self.saved_right = bytearray(self.right.shape[0])
+        self.saved_state, self.next_save = -1, 1  # nada guardado hasta el primer paso
+
+    def grow(self):
+        """Duplica las pilas llenas tras un GROW de run()."""
+        if self.left_top == self.left.shape[0]:
+            self.left = _resized(self.left, self.left_top)
+            self.saved_left = _resized(self.saved_left, self.saved_left_len)
+        if self.right_top == self.right.shape[0]:
+            self.right = _resized(self.right, self.right_top)
+            self.saved_right = _resized(self.saved_right, self.saved_right_len)
+
+    def get_tape(self):
+        return bytes(self.left[:self.left_top]), bytes(self.right[:self.right_top])
+
+    def run(self, long max_steps):
+        """
+        Ejecuta hasta `max_steps` pasos en total, sin el GIL. Devuelve GROW, sin
+        aplicar el paso, si una pila necesita más espacio (llamar a grow() y
+        continuar).
+        """
+        cdef int code
+        with nogil:
+            code = self._run(max_steps)
+        return code
+
+    cdef int _run(self, long max_steps) noexcept nogil:
+        cdef int state = self.state, cur = self.current, nxt, d, code = LOOP
+        cdef long head = self.head, steps = self.steps
+        cdef Py_ssize_t left_top = self.left_top, right_top = self.right_top, lo
+        while steps < max_steps:
+            if self.status[state]:
+                code = ACCEPT if self.status[state] == 1 else REJECT
+                break
+            nxt = self.next_state[state, cur]
+            if nxt < 0:
+                code = REJECT
+                break
+            d = self.move[state, cur]
+            if (d > 0 and left_top == self.left.shape[0]) or (d < 0 and right_top == self.right.shape[0]):
+                code = GROW
+                break
+            cur = self.write_sym[state, cur]
+            state = nxt
+            if d > 0:
+                if left_top or cur != self.blank:  # sin blanks en el extremo
+                    self.left[left_top] = cur
+                    left_top += 1
+                if right_top:
+                    right_top -= 1
+                    cur = self.right[right_top]
+                else:
+                    cur = self.blank
+                head += 1
+            elif d < 0:
+                if right_top or cur != self.blank:
+                    self.right[right_top] = cur
+                    right_top += 1
+                if left_top:
+                    left_top -= 1
+                    cur = self.left[left_top]
+                else:
+                    cur = self.blank
+                head -= 1
+            steps += 1
+            if steps == self.next_save:
+                self.saved_state, self.saved_head, self.saved_current = state, head, cur
+                lo = _edge(self.left, left_top, self.blank)
+                self.saved_left[:left_top - lo] = self.left[lo:left_top]
+                self.saved_left_len = left_top - lo
+                lo = _edge(self.right, right_top, self.blank)
+                self.saved_right[:right_top - lo] = self.right[lo:right_top]
+                self.saved_right_len = right_top - lo
+                self.next_save *= 2
+            elif (state == self.saved_state and head == self.saved_head
+                  and cur == self.saved_current
+                  and _same_stack(self.left, left_top, self.saved_left,
+                                  self.saved_left_len, self.blank)
+                  and _same_stack(self.right, right_top, self.saved_right,
+                                  self.saved_right_len, self.blank)):
+                break  # configuración repetida: la MT no se detiene
+        self.state, self.current, self.head, self.steps = state, cur, head, steps
+        self.left_top, self.right_top = left_top, right_top
+        return code
@@ -1,231 +1,1048 @@
-import json
-import sys
-
-class Tape:
-    """
-    Clase para simular la cinta infinita de la MT.
-    Usa un diccionario para posiciones (enteros) -> símbolo.
-    El blank es '_' por defecto.
-    """
-    def __init__(self, initial_content="", blank="_"):
-        self.content = {}
-        self.blank = blank
-        self.head = 0
-        if initial_content:
-            for i, sym in enumerate(initial_content):
-                self.content[i] = sym
-
-    def read(self):
-        return self.content.get(self.head, self.blank)
-
-    def write(self, sym):
-        if sym == self.blank and self.head not in self.content:
-            if self.head in self.content:
-                del self.content[self.head]
-        else:
-            self.content[self.head] = sym
-
-    def move(self, direction):
-        if direction == 'R':
-            self.head += 1
-        elif direction == 'L':
-            self.head -= 1
-        # 'N' No hace nada
-
-    def __str__(self):
-        if not self.content:
-            return f"...{self.blank}[{self.blank}]..."
-        positions = sorted(self.content.keys())
-        if not positions:
-            return f"...{self.blank}[{self.blank}]..."
-        min_pos, max_pos = min(positions), max(positions)
-        start = max(min_pos - 5, self.head - 25, -50)
-        end = min(max_pos + 5, self.head + 25, 50)
-        s = []
-        for pos in range(start, end + 1):
-            sym = self.content.get(pos, self.blank)
-            if pos == self.head:
-                s.append(f"[{sym}]")
-            else:
-                s.append(sym)
-        left_ellipsis = "..." if start > min_pos - 5 else ""
-        right_ellipsis = "..." if end < max_pos + 5 else ""
-        return left_ellipsis + "".join(s) + right_ellipsis
-
-
-class TransitionFunction:
-    """
-    Función de transición δ: (estado, símbolo) -> (nuevo_estado, nuevo_símbolo, dirección)
-    Almacenada en un diccionario para acceso O(1).
-    """
-    def __init__(self):
-        self.transitions = {}
-
-    def add(self, current_state, read_sym, next_state, write_sym, direction):
-        key = (current_state, read_sym)
-        self.transitions[key] = (next_state, write_sym, direction)
-
-    def get(self, state, sym):
-        return self.transitions.get((state, sym))
-
-
-class TuringMachine:
-    """
-    Clase principal para la Máquina de Turing.
-    Refleja la definición formal: 7-tupla (Q, Σ, Γ, δ, q0, F, B).
-    """
-    def __init__(self, states, input_alphabet, tape_alphabet, initial_state, accept_states, blank="_"):
-        self.states = states
-        self.input_alphabet = input_alphabet
-        self.tape_alphabet = tape_alphabet
-        self.initial_state = initial_state
-        self.accept_states = accept_states
-        self.reject_states = {"q_reject"}
-        self.blank = blank
-        self.transition_function = TransitionFunction()
-        self.current_state = None
-        self.tape = None
-
-    def add_transition(self, current, read, next_s, write, dir):
-        self.transition_function.add(current, read, next_s, write, dir)
-
-    def load_input(self, input_str):
-        if any(c not in self.input_alphabet + [self.blank] for c in input_str):
-            raise ValueError("Símbolos inválidos en la entrada.")
-        self.tape = Tape(input_str, self.blank)
-        self.current_state = self.initial_state
-
-    def step(self):
-        if self.current_state in self.accept_states:
-            return 'accept'
-        if self.current_state in self.reject_states:
-            return 'reject'
-
-        sym = self.tape.read()
-        trans = self.transition_function.get(self.current_state, sym)
-        if trans is None:
-            return 'reject'
-
-        next_state, write_sym, direction = trans
-        self.tape.write(write_sym)
-        self.tape.move(direction)
-        self.current_state = next_state
-        return 'continue'
-
-    def run(self, max_steps=10000, step_by_step=False):
-        if not self.tape:
-            raise ValueError("Carga una entrada primero con load_input().")
-        history = []
-        steps = 0
-        while steps < max_steps:
-            config = self.get_config()
-            history.append(config)
-            if step_by_step:
-                print(f"Paso {steps + 1}: {config}")
-                input("Presiona Enter para continuar....")
-            result = self.step()
-            if result != 'continue':
-                final_config = self.get_config()
-                history.append(final_config)
-                return result, history
-            steps += 1
-        return 'loop', history
-
-    def get_config(self):
-        return {
-            'estado': self.current_state,
-            'cinta': str(self.tape),
-            'cabezal': self.tape.head
-        }
-
-
-def create_on1n_machine():
-    """
-    Crea una MT estricta para L = {0^n 1^n | n >= 0}.
-    - q0: Escanea 0s desde izquierda; al ver Y (fin de 0s), va a q3.
-    - q1: Busca 1 después de marcar 0 (salta 0s/X/Y).
-    - q2: Regresa izquierda hasta blank inicial.
-    - q3: Verifica solo X/Y hasta blank (rechaza 0/1 extras).
-    Alfabeto cinta: {0,1,X=0 marcado,Y=1 marcado,_}
-    """
-    states = ["q0", "q1", "q2", "q3", "q_accept", "q_reject"]
-    input_alphabet = ["0", "1"]
-    tape_alphabet = ["0", "1", "X", "Y", "_"]
-    initial = "q0"
-    accept = ["q_accept"]
-
-    tm = TuringMachine(states, input_alphabet, tape_alphabet, initial, accept, "_")
-
-    # q0: escanear desde izquierda para 0 no marcado o fin de fase 0s
-    tm.add_transition("q0", "_", "q3", "_", "R")  # Blank inicial: verificar (cadena vacía o fin)
-    tm.add_transition("q0", "0", "q1", "X", "R")  # Marcar 0, buscar 1
-    tm.add_transition("q0", "1", "q_reject", "1", "N")  # 1 prematuro: rechazar
-    tm.add_transition("q0", "X", "q0", "X", "R")  # Saltar 0 marcado
-    tm.add_transition("q0", "Y", "q3", "Y", "R")  # CORRECCIÓN CLAVE: Fin de 0s (primer Y), ir a verificación
-
-    # q1: buscar 1 no marcado (salta 0s restantes, X, Y)
-    tm.add_transition("q1", "0", "q1", "0", "R")  # Saltar 0s no procesados
-    tm.add_transition("q1", "1", "q2", "Y", "L")  # Marcar 1, regresar izquierda
-    tm.add_transition("q1", "X", "q1", "X", "R")  # Saltar X
-    tm.add_transition("q1", "Y", "q1", "Y", "R")  # Saltar Y (1s ya marcados)
-    tm.add_transition("q1", "_", "q_reject", "_", "N")  # Sin 1 correspondiente: rechazar
-
-    # q2: regresar izquierda hasta blank inicial
-    tm.add_transition("q2", "_", "q0", "_", "R")  # Llegó izquierda, reiniciar q0
-    tm.add_transition("q2", "0", "q2", "0", "L")  # Saltar
-    tm.add_transition("q2", "1", "q2", "1", "L")  # Saltar (por completitud)
-    tm.add_transition("q2", "X", "q2", "X", "L")  # Saltar
-    tm.add_transition("q2", "Y", "q2", "Y", "L")  # Saltar
-
-    # q3: verificar sin símbolos no marcados (solo X/Y permitidos)
-    tm.add_transition("q3", "X", "q3", "X", "R")  # Saltar X
-    tm.add_transition("q3", "Y", "q3", "Y", "R")  # Saltar Y
-    tm.add_transition("q3", "0", "q_reject", "0", "N")  # 0 extra: rechazar
-    tm.add_transition("q3", "1", "q_reject", "1", "N")  # 1 extra: rechazar
-    tm.add_transition("q3", "_", "q_accept", "_", "N")  # Todo marcado correctamente: aceptar
-
-    return tm
-
-
-def main():
-    tm = create_on1n_machine()
-    print("Simulador de MT para {0^n 1^n} estricta.")
-    input_str = input("Ingresa la cadena de entrada (ej. 0101): ").strip()
-    tm.load_input(input_str)
-
-    mode = input("Modo: 'auto' o 'step' (paso a paso)? ").strip().lower()
-    step_by_step = mode == 'step'
-
-    result, history = tm.run(step_by_step=step_by_step, max_steps=10000)
-    print(f"\nResultado: {result.upper()}")
-    if result == 'loop':
-        print("Se detectó un posible bucle (límite de pasos alcanzado).")
-    print(f"Pasos totales: {len(history) - 1}")
-    print("Configuración final:")
-    print(f"Estado: {history[-1]['estado']}")
-    print(f"Cinta: {history[-1]['cinta']}")
-    print(f"Cabezal: {history[-1]['cabezal']}")
-
-
-# Pruebas unitarias básicas
-if __name__ == "__main__":
-    print("=== PRUEBAS ===")
-    tm = create_on1n_machine()
-
-    tests = [
-        ("", "accept"),       # n=0
-        ("01", "accept"),     # n=1
-        ("0011", "accept"),   # n=2
-        ("001", "reject"),    # Más 0s que 1s
-        ("1100", "reject"),   # Orden invertido (1s antes)
-        ("0101", "reject")    # Intercalado (igual conteo pero orden malo)
-    ]
-
-    for inp, expected in tests:
-        tm.load_input(inp)
-        result, _ = tm.run(step_by_step=False, max_steps=1000)
-        status = "OK" if result == expected else "FAIL"
-        print(f"Entrada '{inp}': {result} (esperado: {expected}) - {status}")
-
-    print("\nModo interactivo.")
+import contextlib
+import ctypes
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from array import array
+
+try:  # Numba es opcional: sin él run() usa el bucle en Python puro
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+try:  # Lectura de una sola tecla en modo paso a paso: termios (POSIX) o msvcrt (Windows)
+    import termios
+    import tty
+except ImportError:
+    termios = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+try:  # Núcleo Cython opcional: python build_core.py build_ext --inplace
+    from turing_core import TuringMachineC
+except ImportError:
+    TuringMachineC = None
+
+# Direcciones del cabezal codificadas como desplazamiento entero
+DIRECTIONS = {'R': 1, 'L': -1, 'N': 0}
+
+# Códigos de resultado de los bucles compilados (Numba y turing_core)
+_ACCEPT, _REJECT, _LOOP, _GROW = 0, 1, 2, 3
+_RESULTS = ('accept', 'reject', 'loop')
+
+# Estado de parada por id de estado (TuringMachine._status)
+_CONTINUE, _ACCEPT_STATE, _REJECT_STATE = 0, 1, 2
+
+class Tape:
+    """
+    Clase para simular la cinta infinita de la MT.
+    Representación de dos pilas: `left` guarda las celdas a la izquierda del
+    cabezal y `right` las de la derecha (invertida, para que la celda vecina
+    quede al final y `pop()` sea O(1)); `current` es la celda bajo el cabezal.
+    Las celdas guardan códigos enteros de símbolo; `symbols` traduce
+    código -> símbolo al mostrar la cinta y `display`, si se da, es la misma
+    traducción como tabla de bytes.translate (ver _display_table). El blank es
+    el código 0 por defecto.
+    """
+    __slots__ = ('blank', 'symbols', '_display', 'head', 'left', 'right', 'current')
+
+    def __init__(self, initial_content=b"", blank=0, symbols="_", display=None):
+        self.blank = blank
+        self.symbols = symbols
+        self._display = display
+        self.head = 0
+        self.left = bytearray()
+        self.right = bytearray(initial_content[:0:-1])
+        self.current = initial_content[0] if initial_content else blank
+
+    def copy(self):
+        tape = Tape(b"", self.blank, self.symbols, self._display)
+        tape.head, tape.current = self.head, self.current
+        tape.left[:], tape.right[:] = self.left, self.right
+        return tape
+
+    def read(self):
+        return self.current
+
+    def write(self, sym):
+        self.current = sym
+
+    def move(self, direction):
+        # direction: +1 (R), -1 (L) o 0 (N, no hace nada).
+        # Un blank que queda en el extremo de la cinta no se apila: así la
+        # cinta no crece con blanks al recorrer más allá de su contenido.
+        if direction > 0:
+            if self.left or self.current != self.blank:
+                self.left.append(self.current)
+            self.current = self.right.pop() if self.right else self.blank
+            self.head += 1
+        elif direction < 0:
+            if self.right or self.current != self.blank:
+                self.right.append(self.current)
+            self.current = self.left.pop() if self.left else self.blank
+            self.head -= 1
+
+    def __str__(self):
+        left, right, head = self.left, self.right, self.head
+        if not left and not right and self.current == self.blank:
+            blank = self.symbols[self.blank]
+            return f"...{blank}[{blank}]..."
+        # Los extremos salen de las longitudes de las pilas y solo se copia la
+        # ventana visible: el coste no depende del largo de la cinta.
+        min_pos, max_pos = head - len(left), head + len(right)
+        start = max(min_pos - 5, head - 25, -50)
+        end = min(max_pos + 5, head + 25, 50)
+        # Copia la ventana [start, end] de las pilas a un buffer de códigos
+        buf = bytearray([self.blank]) * max(end - start + 1, 0)
+        lo, hi = max(start, min_pos), min(end, head - 1)
+        if lo <= hi:
+            buf[lo - start:hi - start + 1] = left[lo - min_pos:hi - min_pos + 1]
+        lo, hi = max(start, head + 1), min(end, max_pos)
+        if lo <= hi:
+            buf[lo - start:hi - start + 1] = right[max_pos - hi:max_pos - lo + 1][::-1]
+        if self._display is not None:
+            buf = buf.translate(self._display)
+            if start <= head <= end:
+                i = head - start
+                buf[i:i + 1] = b"[%c]" % self._display[self.current]
+            window = buf.decode('latin-1')
+        else:
+            # Símbolos de varios caracteres o fuera de latin-1
+            cells = [self.symbols[sym] for sym in buf]
+            if start <= head <= end:
+                i = head - start
+                cells[i] = f"[{cells[i]}]"
+            window = "".join(cells)
+        left_ellipsis = "..." if start > min_pos - 5 else ""
+        right_ellipsis = "..." if end < max_pos + 5 else ""
+        return left_ellipsis + window + right_ellipsis
+
+
+def _display_table(symbols):
+    """
+    Tabla de bytes.translate código -> carácter para Tape.__str__, o None si
+    algún símbolo no es un único carácter latin-1.
+    """
+    if not all(len(sym) == 1 and ord(sym) < 256 for sym in symbols):
+        return None
+    return bytes.maketrans(bytes(range(len(symbols))), "".join(symbols).encode('latin-1'))
+
+
+def _int_column(typecode, size):
+    """Columna preasignada de enteros: numpy si está disponible, si no array.array."""
+    if np is not None:
+        return np.empty(size, dtype={'h': np.int16, 'i': np.int32}[typecode])
+    return array(typecode, bytes(size * array(typecode).itemsize))
+
+
+def _tape_key(left, current, right, blank):
+    """Forma canónica del contenido de la cinta (sin blanks en los extremos)."""
+    edge = bytes((blank,))
+    return current, left.lstrip(edge), right.lstrip(edge)
+
+
+@contextlib.contextmanager
+def _key_waiter(prompt, line_prompt):
+    """
+    Da una función que muestra `prompt` y espera una sola tecla, sin Enter ni
+    el búfer de línea de input(): la terminal queda en modo cbreak mientras
+    dura el bloque y se restaura al salir. Si stdin no es una terminal (p. ej.
+    entrada redirigida) se usa input(line_prompt), que espera un Enter.
+    """
+    if not sys.stdin.isatty() or (termios is None and msvcrt is None):
+        yield lambda: input(line_prompt)
+        return
+    if termios is None:
+        def wait():
+            print(prompt, end="", flush=True)
+            msvcrt.getwch()
+            print()
+        yield wait
+        return
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+
+        def wait():
+            print(prompt, end="", flush=True)
+            os.read(fd, 1)
+            print()
+        yield wait
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+class TransitionFunction:
+    """
+    Función de transición δ: (estado, símbolo) -> (nuevo_estado, nuevo_símbolo, dirección)
+    Almacenada como tabla 2-D `table[id_estado][código_símbolo]` para acceso
+    O(1) sin construir ni hashear tuplas; las celdas sin transición son None.
+    """
+    __slots__ = ('table',)
+
+    def __init__(self, num_states, num_symbols):
+        self.table = [[None] * num_symbols for _ in range(num_states)]
+
+    def add(self, current_state, read_sym, next_state, write_sym, direction):
+        self.table[current_state][read_sym] = (next_state, write_sym, direction)
+
+    def get(self, state, sym):
+        return self.table[state][sym]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _edge(stack, top, blank):
+        """Índice del fondo de `stack[:top]` tras saltar los blanks del extremo."""
+        lo = 0
+        while lo < top and stack[lo] == blank:
+            lo += 1
+        return lo
+
+    @njit(cache=True)
+    def _same_stack(stack, top, saved, saved_len, blank):
+        lo = _edge(stack, top, blank)
+        if top - lo != saved_len:
+            return False
+        for i in range(saved_len):
+            if stack[lo + i] != saved[i]:
+                return False
+        return True
+
+    @njit(cache=True)
+    def _run_nb(next_state, write_sym, move, status, blank,
+                left, left_top, right, right_top, state, cur, head, steps, max_steps,
+                brent, saved_left, saved_right):
+        """
+        Bucle de run() compilado: tablas int8[estados, símbolos] (next_state -1 =
+        sin transición), `status` int8[estados] con _CONTINUE/_ACCEPT_STATE/
+        _REJECT_STATE y pilas de la cinta preasignadas con su tope explícito.
+        Devuelve _GROW, sin aplicar el paso, si una pila necesita más espacio.
+        La detección de ciclos de Brent es la de run(): `brent` guarda
+        [próximo guardado, estado, cabezal, celda actual, largo de cada pila]
+        de la configuración guardada, cuyas pilas sin los blanks del extremo
+        están en saved_left/saved_right (con la capacidad de left/right).
+        """
+        next_save, saved_state, saved_head = brent[0], brent[1], brent[2]
+        code = _LOOP
+        while steps < max_steps:
+            st = status[state]
+            if st:
+                code = _ACCEPT if st == _ACCEPT_STATE else _REJECT
+                break
+            nxt = next_state[state, cur]
+            if nxt < 0:
+                code = _REJECT
+                break
+            d = move[state, cur]
+            if (d > 0 and left_top == left.shape[0]) or (d < 0 and right_top == right.shape[0]):
+                code = _GROW
+                break
+            cur = write_sym[state, cur]
+            state = nxt
+            if d > 0:
+                if left_top or cur != blank:
+                    left[left_top] = cur
+                    left_top += 1
+                if right_top:
+                    right_top -= 1
+                    cur = right[right_top]
+                else:
+                    cur = blank
+                head += 1
+            elif d < 0:
+                if right_top or cur != blank:
+                    right[right_top] = cur
+                    right_top += 1
+                if left_top:
+                    left_top -= 1
+                    cur = left[left_top]
+                else:
+                    cur = blank
+                head -= 1
+            steps += 1
+            if steps == next_save:
+                saved_state, saved_head = state, head
+                lo = _edge(left, left_top, blank)
+                saved_left[:left_top - lo] = left[lo:left_top]
+                brent[3], brent[4] = cur, left_top - lo
+                lo = _edge(right, right_top, blank)
+                saved_right[:right_top - lo] = right[lo:right_top]
+                brent[5] = right_top - lo
+                next_save *= 2
+            elif (state == saved_state and head == saved_head and cur == brent[3]
+                  and _same_stack(left, left_top, saved_left, brent[4], blank)
+                  and _same_stack(right, right_top, saved_right, brent[5], blank)):
+                break  # configuración repetida: la MT no se detiene
+        brent[0], brent[1], brent[2] = next_save, saved_state, saved_head
+        return code, state, cur, head, left_top, right_top, steps
+else:
+    _run_nb = None
+
+
+class TuringMachine:
+    """
+    Clase principal para la Máquina de Turing.
+    Refleja la definición formal: 7-tupla (Q, Σ, Γ, δ, q0, F, B).
+    """
+    __slots__ = (
+        'states', 'input_alphabet', 'tape_alphabet', 'initial_state', 'accept_states',
+        'reject_states', 'blank', 'transition_function', 'current_state', 'tape', 'steps',
+        '_code_sym', '_sym_code', '_display', '_strip_valid_input', '_encode_input',
+        '_state_id', '_status', '_history',
+        '_nb_tables', '_core', '_c_lib', '_run_fast',
+    )
+
+    def __init__(self, states, input_alphabet, tape_alphabet, initial_state, accept_states, blank="_"):
+        self.states = states
+        self.input_alphabet = input_alphabet
+        self.tape_alphabet = tape_alphabet
+        self.initial_state = initial_state
+        self.accept_states = accept_states
+        self.reject_states = {"q_reject"}
+        self.blank = blank
+        # Codificación de símbolos de cinta a enteros pequeños (blank = 0)
+        self._code_sym = [blank] + [sym for sym in tape_alphabet if sym != blank]
+        self._sym_code = {sym: code for code, sym in enumerate(self._code_sym)}
+        self._display = _display_table(self._code_sym)
+        # Tablas de str.translate para validar y codificar la entrada en C:
+        # borrar los símbolos válidos deja vacía una entrada correcta. Solo
+        # cuentan los símbolos de un carácter con código de cinta; el resto
+        # no puede aparecer en una cadena de entrada válida.
+        valid_input_chars = frozenset(sym for sym in set(input_alphabet) | {blank}
+                                      if len(sym) == 1 and sym in self._sym_code)
+        self._strip_valid_input = str.maketrans('', '', ''.join(valid_input_chars))
+        self._encode_input = str.maketrans({sym: chr(self._sym_code[sym])
+                                            for sym in valid_input_chars})
+        # Estados identificados por su índice en `states`
+        self._state_id = {state: i for i, state in enumerate(states)}
+        # Un load indexado por paso en vez de dos búsquedas en conjuntos
+        self._status = bytearray(len(states))
+        for s in self.reject_states:
+            if s in self._state_id:
+                self._status[self._state_id[s]] = _REJECT_STATE
+        for s in accept_states:
+            self._status[self._state_id[s]] = _ACCEPT_STATE
+        self.transition_function = TransitionFunction(len(states), len(self._code_sym))
+        self.current_state = None  # id entero del estado actual
+        self.tape = None
+        self.steps = 0
+        self._history = None  # (cinta inicial, estados, cabezales) del último run(record=True)
+        self._nb_tables = None
+        self._core = None
+        self._c_lib = None  # programa C de compile_to_c(), si se generó
+        self._run_fast = None  # bucle especializado de compile()
+
+    def add_transition(self, current, read, next_s, write, dir):
+        self._nb_tables = None
+        self._core = None
+        self._c_lib = None
+        self._run_fast = None
+        sid, code = self._state_id, self._sym_code
+        self.transition_function.add(sid[current], code[read], sid[next_s],
+                                     code[write], DIRECTIONS[dir])
+
+    def load_input(self, input_str):
+        if input_str.translate(self._strip_valid_input):
+            raise ValueError("Símbolos inválidos en la entrada.")
+        codes = input_str.translate(self._encode_input).encode('latin-1')
+        self.tape = Tape(codes, 0, self._code_sym, self._display)
+        self.current_state = self._state_id[self.initial_state]
+        self.steps = 0
+
+    def step(self):
+        status = self._status[self.current_state]
+        if status:
+            return 'accept' if status == _ACCEPT_STATE else 'reject'
+
+        trans = self.transition_function.table[self.current_state][self.tape.current]
+        if trans is None:
+            return 'reject'
+
+        # Movimiento en línea con la dirección ya codificada (+1/-1/0)
+        self.current_state, cur, direction = trans
+        tape = self.tape
+        if direction > 0:
+            if tape.left or cur != tape.blank:
+                tape.left.append(cur)
+            cur = tape.right.pop() if tape.right else tape.blank
+            tape.head += 1
+        elif direction < 0:
+            if tape.right or cur != tape.blank:
+                tape.right.append(cur)
+            cur = tape.left.pop() if tape.left else tape.blank
+            tape.head -= 1
+        tape.current = cur
+        return 'continue'
+
+    def run(self, max_steps=10000, step_by_step=False, record=False, burst=1):
+        """
+        Ejecuta la MT hasta aceptar, rechazar o agotar `max_steps` ('loop').
+        También devuelve 'loop' en cuanto se repite una configuración
+        (estado, cabezal, cinta), detectado con el método de Brent: se guarda
+        la configuración en los pasos potencia de 2 y se compara con las
+        siguientes. Todos los backends la detectan en el mismo paso.
+        Devuelve (resultado, historial). El historial es None salvo en modo
+        paso a paso o con record=True, en los que es el par de columnas (ids
+        de estado int16, o int32 con más de 32767 estados; cabezales int32),
+        una entrada por configuración, sin renderizar la cinta;
+        get_history_dicts() reconstruye los dicts bajo demanda. La
+        configuración final se consulta con get_config() y `self.steps` queda
+        con las transiciones ejecutadas.
+        En modo paso a paso se muestran `burst` (>= 1) configuraciones entre
+        pausas y cada pausa espera una sola tecla.
+        """
+        if not self.tape:
+            raise ValueError("Carga una entrada primero con load_input().")
+        if burst < 1:
+            raise ValueError(f"burst debe ser un entero >= 1 (se recibió {burst!r}).")
+        if step_by_step:
+            with _key_waiter("Presiona una tecla para continuar....",
+                             "Presiona Enter para continuar....") as wait:
+                return self._run_traced(max_steps, wait, True, burst)
+        if record:
+            return self._run_traced(max_steps, None, record)
+        # Primero lo que se pidió explícitamente (compile_to_c(), compile()) y
+        # después los núcleos opcionales instalados
+        if self._c_lib is not None:
+            return self._run_c(max_steps), None
+        if self._run_fast is not None:
+            return self._run_specialized(max_steps), None
+        fits_int8 = max(len(self.states), len(self._code_sym)) < 128
+        if TuringMachineC is not None and fits_int8:
+            return self._run_cython(max_steps), None
+        if _run_nb is not None and fits_int8:
+            return self._run_numba(max_steps), None
+        return self._run_python(max_steps), None
+
+    def _run_python(self, max_steps):
+        """Bucle de step() en línea: solo enteros y las dos pilas de la cinta."""
+        table = self.transition_function.table
+        status = self._status
+        tape = self.tape
+        left, right, blank = tape.left, tape.right, tape.blank
+        state, cur, head = self.current_state, tape.current, tape.head
+        saved_state, saved_head = state, head
+        saved_key = _tape_key(left, cur, right, blank)
+        next_save = 1
+        result = 'loop'
+        steps = 0
+        while steps < max_steps:
+            st = status[state]
+            if st:
+                result = 'accept' if st == _ACCEPT_STATE else 'reject'
+                break
+            trans = table[state][cur]
+            if trans is None:
+                result = 'reject'
+                break
+            state, cur, direction = trans
+            if direction > 0:
+                if left or cur != blank:
+                    left.append(cur)
+                cur = right.pop() if right else blank
+                head += 1
+            elif direction < 0:
+                if right or cur != blank:
+                    right.append(cur)
+                cur = left.pop() if left else blank
+                head -= 1
+            steps += 1
+            if steps == next_save:
+                saved_state, saved_head = state, head
+                saved_key = _tape_key(left, cur, right, blank)
+                next_save *= 2
+            elif (state == saved_state and head == saved_head
+                  and _tape_key(left, cur, right, blank) == saved_key):
+                break  # configuración repetida: la MT no se detiene
+        self.current_state, tape.current, tape.head = state, cur, head
+        self.steps = steps
+        return result
+
+    def compile(self):
+        """
+        Especializa el bucle de run() para esta MT: genera el código Python de
+        una función con la tabla de transición desplegada en if/elif sobre
+        literales (estado, código de símbolo), la compila con exec y la guarda
+        en `self._run_fast`. Mantiene la detección de ciclos de run().
+        Los barridos ("mientras el símbolo esté en S, dejarlo igual y seguir en
+        la misma dirección") se resuelven de una vez: bytearray.rstrip(S) sobre
+        la pila hacia la que avanza el cabezal da la longitud de la racha en C,
+        y se trasladan esas celdas con un par de operaciones de slice. El
+        barrido se corta en max_steps, en el próximo guardado de Brent y donde
+        el cabezal pasa por el de la configuración guardada, así que el ciclo
+        se detecta en el mismo paso que en run().
+        """
+        names, syms, blank = self.states, self._code_sym, 0
+        src = [
+            "def _run(left, right, state, cur, head, max_steps):",
+            "    saved_state, saved_head = state, head",
+            f"    saved_key = _tape_key(left, cur, right, {blank})",
+            "    next_save = 1",
+            "    steps = 0",
+            "    while steps < max_steps:",
+        ]
+        keyword = "if"
+        for sid, row in enumerate(self.transition_function.table):
+            src.append(f"        {keyword} state == {sid}:  # {names[sid]}")
+            keyword = "elif"
+            status = self._status[sid]
+            if status:
+                code = _ACCEPT if status == _ACCEPT_STATE else _REJECT
+                src.append(f"            return {code}, state, cur, head, steps")
+                continue
+            sym_keyword = "if"
+            skipped = set()
+            for direction, src_stack, dst_stack, sign, ahead in (
+                    (1, "right", "left", "+", "saved_head - head"),
+                    (-1, "left", "right", "-", "head - saved_head")):
+                # Sin el blank: un barrido sobre blanks no termina nunca
+                run_syms = bytes(sym for sym, trans in enumerate(row)
+                                 if trans == (sid, sym, direction) and sym != blank)
+                if not run_syms:
+                    continue
+                skipped.update(run_syms)
+                src += [
+                    f"            {sym_keyword} cur in {run_syms!r}:  "
+                    f"# barrido {'/'.join(syms[c] for c in run_syms)}",
+                    f"                k = len({src_stack}) - len({src_stack}.rstrip({run_syms!r}))",
+                    "                k = min(k, min(max_steps, next_save) - steps - 1)",
+                    f"                if saved_state == {sid} and 0 < {ahead} <= k:",
+                    f"                    k = {ahead} - 1",
+                    f"                {dst_stack}.append(cur)",
+                    "                if k:",
+                    f"                    {dst_stack} += {src_stack}[-k:][::-1]",
+                    f"                    del {src_stack}[-k:]",
+                    f"                cur = {src_stack}.pop() if {src_stack} else {blank}",
+                    f"                head {sign}= k + 1",
+                    "                steps += k",
+                ]
+                sym_keyword = "elif"
+            for sym, trans in enumerate(row):
+                if trans is None or sym in skipped:
+                    continue
+                next_state, write_sym, direction = trans
+                src.append(f"            {sym_keyword} cur == {sym}:  "
+                           f"# {syms[sym]} -> {syms[write_sym]}, {names[next_state]}")
+                sym_keyword = "elif"
+                body = []
+                if direction > 0:
+                    # El símbolo escrito se conoce aquí: solo un blank en el
+                    # extremo necesita la comprobación para no apilarse.
+                    body.append(f"left.append({write_sym})" if write_sym != blank
+                                else f"if left: left.append({blank})")
+                    body += [f"cur = right.pop() if right else {blank}", "head += 1"]
+                elif direction < 0:
+                    body.append(f"right.append({write_sym})" if write_sym != blank
+                                else f"if right: right.append({blank})")
+                    body += [f"cur = left.pop() if left else {blank}", "head -= 1"]
+                elif write_sym != sym:
+                    body.append(f"cur = {write_sym}")
+                if next_state != sid:
+                    body.append(f"state = {next_state}")
+                src += ["                " + line for line in body or ["pass"]]
+            if sym_keyword == "if":
+                src.append(f"            return {_REJECT}, state, cur, head, steps")
+            else:
+                src += ["            else:",
+                        f"                return {_REJECT}, state, cur, head, steps"]
+        if keyword == "elif":
+            src += ["        else:", f"            return {_REJECT}, state, cur, head, steps"]
+        src += [
+            "        steps += 1",
+            "        if steps == next_save:",
+            "            saved_state, saved_head = state, head",
+            f"            saved_key = _tape_key(left, cur, right, {blank})",
+            "            next_save *= 2",
+            "        elif (state == saved_state and head == saved_head",
+            f"              and _tape_key(left, cur, right, {blank}) == saved_key):",
+            "            break",
+            f"    return {_LOOP}, state, cur, head, steps",
+        ]
+        namespace = {'_tape_key': _tape_key}
+        exec("\n".join(src), namespace)
+        self._run_fast = namespace['_run']
+        return self._run_fast
+
+    def _run_specialized(self, max_steps):
+        """Ejecuta el bucle de compile() sobre las pilas de la cinta."""
+        tape = self.tape
+        code, self.current_state, tape.current, tape.head, self.steps = self._run_fast(
+            tape.left, tape.right, self.current_state, tape.current, tape.head, max_steps)
+        return _RESULTS[code]
+
+    def _numba_tables(self):
+        """Tablas int8 (next_state, write_sym, move, status) para _run_nb."""
+        if self._nb_tables is None:
+            shape = (len(self.states), len(self._code_sym))
+            next_state = np.full(shape, -1, dtype=np.int8)
+            write_sym = np.zeros(shape, dtype=np.int8)
+            move = np.zeros(shape, dtype=np.int8)
+            for state, row in enumerate(self.transition_function.table):
+                for sym, trans in enumerate(row):
+                    if trans is not None:
+                        next_state[state, sym], write_sym[state, sym], move[state, sym] = trans
+            status = np.frombuffer(self._status, dtype=np.int8).copy()
+            self._nb_tables = (next_state, write_sym, move, status)
+        return self._nb_tables
+
+    def _run_numba(self, max_steps):
+        """Empaqueta la cinta en arrays int8, ejecuta _run_nb y desempaqueta el estado final."""
+        tables = self._numba_tables()
+        tape = self.tape
+        left = np.zeros(max(2 * len(tape.left), 64), dtype=np.int8)
+        left[:len(tape.left)] = np.frombuffer(tape.left, dtype=np.int8)
+        right = np.zeros(max(2 * len(tape.right), 64), dtype=np.int8)
+        right[:len(tape.right)] = np.frombuffer(tape.right, dtype=np.int8)
+        left_top, right_top = len(tape.left), len(tape.right)
+        state, cur, head, steps = self.current_state, tape.current, tape.head, 0
+        # Sin configuración guardada hasta el primer paso (estado -1)
+        brent = np.array([1, -1, 0, 0, 0, 0], dtype=np.int64)
+        saved_left, saved_right = np.empty_like(left), np.empty_like(right)
+        while True:
+            code, state, cur, head, left_top, right_top, steps = _run_nb(
+                *tables, tape.blank, left, left_top, right, right_top,
+                state, cur, head, steps, max_steps, brent, saved_left, saved_right)
+            if code != _GROW:
+                break
+            # Duplica la pila llena (y su copia guardada) y continúa desde el mismo paso
+            if left_top == left.shape[0]:
+                left = np.concatenate((left, np.zeros_like(left)))
+                saved_left = np.concatenate((saved_left, np.empty_like(saved_left)))
+            if right_top == right.shape[0]:
+                right = np.concatenate((right, np.zeros_like(right)))
+                saved_right = np.concatenate((saved_right, np.empty_like(saved_right)))
+        tape.left[:] = left[:left_top].tobytes()
+        tape.right[:] = right[:right_top].tobytes()
+        self.current_state, tape.current, tape.head = int(state), int(cur), int(head)
+        self.steps = int(steps)
+        return _RESULTS[code]
+
+    def _run_cython(self, max_steps):
+        """Ejecuta el bucle en TuringMachineC (turing_core) y copia el estado final a la cinta."""
+        if self._core is None:
+            self._core = TuringMachineC(self.transition_function.table, self._status)
+        core, tape = self._core, self.tape
+        core.load(tape.left, tape.right, tape.current, tape.head, self.current_state)
+        code = core.run(max_steps)
+        while code == _GROW:
+            core.grow()
+            code = core.run(max_steps)
+        tape.left[:], tape.right[:] = core.get_tape()
+        self.current_state, tape.current, tape.head = core.state, core.current, core.head
+        self.steps = core.steps
+        return _RESULTS[code]
+
+    def _run_c(self, max_steps):
+        """
+        Ejecuta el programa de compile_to_c() sobre la cinta aplanada en un buffer
+        con margen de blanks a ambos lados; si el cabezal llega a un borde
+        (_GROW) se amplía el margen, también en la copia guardada por la
+        detección de ciclos, y se continúa.
+        """
+        tape = self.tape
+        cells = tape.left + bytes([tape.current]) + tape.right[::-1]
+        saved = bytearray(len(cells))
+        pos = ctypes.c_long(len(tape.left))
+        base = tape.head - pos.value  # posición en la cinta del índice 0 del buffer
+        state = ctypes.c_int(self.current_state)
+        steps = ctypes.c_long(0)
+        brent = (ctypes.c_long * 3)(1, -1, 0)  # nada guardado hasta el primer paso
+        while True:
+            margin = max(len(cells), 1024)
+            cells = bytearray(margin) + cells + bytearray(margin)
+            saved = bytearray(margin) + saved + bytearray(margin)
+            pos.value += margin
+            brent[2] += margin
+            base -= margin
+            buf = (ctypes.c_ubyte * len(cells)).from_buffer(cells)
+            saved_buf = (ctypes.c_ubyte * len(saved)).from_buffer(saved)
+            code = self._c_lib.run(buf, len(cells), ctypes.byref(pos), ctypes.byref(state),
+                                   ctypes.byref(steps), max_steps, saved_buf, brent)
+            del buf, saved_buf
+            if code != _GROW:
+                break
+        # Blank = 0: los blanks de los extremos no se guardan en las pilas
+        tape.left[:] = cells[:pos.value].lstrip(b"\0")
+        tape.current = cells[pos.value]
+        tape.right[:] = cells[pos.value + 1:].rstrip(b"\0")[::-1]
+        tape.head = base + pos.value
+        self.current_state = state.value
+        self.steps = steps.value
+        return _RESULTS[code]
+
+    def _run_traced(self, max_steps, wait, record, burst=1):
+        """
+        Variante paso a paso de run(), que además puede registrar el historial.
+        Con `wait` (de _key_waiter) muestra cada configuración y llama a
+        wait() cada `burst` pasos.
+        """
+        tape = self.tape
+        if record:
+            state_type = 'h' if len(self.states) <= 0x7fff else 'i'
+            hist_state = _int_column(state_type, max_steps + 1)
+            hist_head = _int_column('i', max_steps + 1)
+            start = tape.copy()
+        # Métodos y pilas en locales: el bucle no recorre cadenas de atributos
+        step, get_config = self.step, self.get_config
+        left, right, blank = tape.left, tape.right, tape.blank
+        saved_state, saved_head = self.current_state, tape.head
+        saved_key = _tape_key(left, tape.current, right, blank)
+        next_save = 1
+        steps = 0
+        result = 'loop'
+        while steps < max_steps:
+            if record:
+                hist_state[steps], hist_head[steps] = self.current_state, tape.head
+            if wait is not None:
+                print(f"Paso {steps + 1}: {get_config()}")
+                if (steps + 1) % burst == 0:
+                    wait()
+            status = step()
+            if status != 'continue':
+                result = status
+                break
+            steps += 1
+            state, head = self.current_state, tape.head
+            if steps == next_save:
+                saved_state, saved_head = state, head
+                saved_key = _tape_key(left, tape.current, right, blank)
+                next_save *= 2
+            elif (state == saved_state and head == saved_head
+                  and _tape_key(left, tape.current, right, blank) == saved_key):
+                break
+        self.steps = steps
+        if not record:
+            return result, None
+        n = steps + (result != 'loop')
+        history = (hist_state[:n], hist_head[:n])
+        self._history = (start,) + history
+        return result, history
+
+    def get_history_dicts(self):
+        """
+        Genera las configuraciones {'estado', 'cinta', 'cabezal'} del último
+        run(record=True) una a una, reejecutando las transiciones sobre una
+        copia de la cinta inicial.
+        """
+        if self._history is None:
+            raise ValueError("Ejecuta primero run(record=True).")
+        start, states, heads = self._history
+        tape = start.copy()
+        table, names, move = self.transition_function.table, self.states, tape.move
+        for state, head in zip(states, heads):
+            yield {'estado': names[state], 'cinta': str(tape), 'cabezal': int(head)}
+            trans = table[state][tape.current]
+            if trans is None:
+                break
+            _, tape.current, direction = trans
+            if direction:
+                move(direction)
+
+    def get_config(self):
+        return {
+            'estado': self.states[self.current_state],
+            'cinta': str(self.tape),
+            'cabezal': self.tape.head
+        }
+
+
+def compile_to_c(tm):
+    """
+    Traduce la MT a C (estilo tm2c): un bloque etiquetado por estado con un
+    `switch` sobre el código de la celda bajo el cabezal que salta con `goto`
+    al siguiente estado, sin tabla de transición. Lo compila con gcc y lo carga
+    con ctypes. La función exportada es
+    int run(unsigned char *tape, long size, long *pos, int *state, long *steps,
+            long max_steps, unsigned char *saved, long *brent)
+    y devuelve uno de los códigos _ACCEPT/_REJECT/_LOOP/_GROW. `saved` (del
+    tamaño de `tape`) y `brent` = {próximo guardado, estado, posición} llevan
+    la configuración guardada por la detección de ciclos de Brent de run().
+    """
+    names, syms = tm.states, tm._code_sym
+    halting = {s: _ACCEPT if st == _ACCEPT_STATE else _REJECT
+               for s, st in enumerate(tm._status) if st}
+    src = [
+        "#include <string.h>",
+        "",
+        "int run(unsigned char *tape, long size, long *pos_io, int *state_io,",
+        "        long *steps_io, long max_steps, unsigned char *saved, long *brent)",
+        "{",
+        "    long pos = *pos_io, steps = *steps_io, last = size - 1;",
+        "    long next_save = brent[0], saved_st = brent[1], saved_pos = brent[2];",
+        f"    int st = *state_io, code = {_REJECT};",
+        "    switch (st) {",
+    ]
+    src += [f"    case {sid}: goto state_{sid};" for sid in range(len(names))]
+    src += ["    default: goto done;", "    }"]
+    for sid, row in enumerate(tm.transition_function.table):
+        src += [
+            f"state_{sid}:  /* {names[sid]} */",
+            f"    if (steps >= max_steps) {{ st = {sid}; code = {_LOOP}; goto done; }}",
+        ]
+        if sid in halting:
+            src.append(f"    st = {sid}; code = {halting[sid]}; goto done;")
+            continue
+        src += [
+            f"    if (pos == 0 || pos == last) {{ st = {sid}; code = {_GROW}; goto done; }}",
+            "    if (steps == next_save) {",
+            f"        memcpy(saved, tape, size); saved_st = {sid}; saved_pos = pos; next_save *= 2;",
+            f"    }} else if (saved_st == {sid} && pos == saved_pos && !memcmp(tape, saved, size)) {{",
+            f"        st = {sid}; code = {_LOOP}; goto done;  /* configuración repetida */",
+            "    }",
+            "    switch (tape[pos]) {",
+        ]
+        for sym, trans in enumerate(row):
+            if trans is None:
+                continue
+            next_state, write_sym, direction = trans
+            body = f"    case {sym}: "
+            if write_sym != sym:
+                body += f"tape[pos] = {write_sym}; "
+            body += {1: "pos++; ", -1: "pos--; ", 0: ""}[direction]
+            body += f"steps++; goto state_{next_state};"
+            body += f"  /* {syms[sym]} -> {syms[write_sym]}, {names[next_state]} */"
+            src.append(body)
+        src += [f"    default: st = {sid}; code = {_REJECT}; goto done;", "    }"]
+    src += [
+        "done:",
+        "    *pos_io = pos; *state_io = st; *steps_io = steps;",
+        "    brent[0] = next_save; brent[1] = saved_st; brent[2] = saved_pos;",
+        "    return code;",
+        "}",
+    ]
+    with tempfile.TemporaryDirectory(prefix="tm2c_") as tmp:
+        c_path, so_path = os.path.join(tmp, "tm.c"), os.path.join(tmp, "tm.so")
+        with open(c_path, "w") as f:
+            f.write("\n".join(src) + "\n")
+        subprocess.run(["gcc", "-O2", "-shared", "-fPIC", "-o", so_path, c_path],
+                       check=True, capture_output=True)
+        lib = ctypes.CDLL(so_path)
+    lib.run.argtypes = [ctypes.POINTER(ctypes.c_ubyte), ctypes.c_long,
+                        ctypes.POINTER(ctypes.c_long), ctypes.POINTER(ctypes.c_int),
+                        ctypes.POINTER(ctypes.c_long), ctypes.c_long,
+                        ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_long)]
+    lib.run.restype = ctypes.c_int
+    return lib
+
+
+def create_on1n_machine():
+    """
+    Crea una MT estricta para L = {0^n 1^n | n >= 0}.
+    - q0: Escanea 0s desde izquierda; al ver Y (fin de 0s), va a q3.
+    - q1: Busca 1 después de marcar 0 (salta 0s/X/Y).
+    - q2: Regresa izquierda hasta blank inicial.
+    - q3: Verifica solo X/Y hasta blank (rechaza 0/1 extras).
+    Alfabeto cinta: {0,1,X=0 marcado,Y=1 marcado,_}
+    """
+    states = ["q0", "q1", "q2", "q3", "q_accept", "q_reject"]
+    input_alphabet = ["0", "1"]
+    tape_alphabet = ["0", "1", "X", "Y", "_"]
+    initial = "q0"
+    accept = ["q_accept"]
+
+    tm = TuringMachine(states, input_alphabet, tape_alphabet, initial, accept, "_")
+
+    # q0: escanear desde izquierda para 0 no marcado o fin de fase 0s
+    tm.add_transition("q0", "_", "q3", "_", "R")  # Blank inicial: verificar (cadena vacía o fin)
+    tm.add_transition("q0", "0", "q1", "X", "R")  # Marcar 0, buscar 1
+    tm.add_transition("q0", "1", "q_reject", "1", "N")  # 1 prematuro: rechazar
+    tm.add_transition("q0", "X", "q0", "X", "R")  # Saltar 0 marcado
+    tm.add_transition("q0", "Y", "q3", "Y", "R")  # CORRECCIÓN CLAVE: Fin de 0s (primer Y), ir a verificación
+
+    # q1: buscar 1 no marcado (salta 0s restantes, X, Y)
+    tm.add_transition("q1", "0", "q1", "0", "R")  # Saltar 0s no procesados
+    tm.add_transition("q1", "1", "q2", "Y", "L")  # Marcar 1, regresar izquierda
+    tm.add_transition("q1", "X", "q1", "X", "R")  # Saltar X
+    tm.add_transition("q1", "Y", "q1", "Y", "R")  # Saltar Y (1s ya marcados)
+    tm.add_transition("q1", "_", "q_reject", "_", "N")  # Sin 1 correspondiente: rechazar
+
+    # q2: regresar izquierda hasta blank inicial
+    tm.add_transition("q2", "_", "q0", "_", "R")  # Llegó izquierda, reiniciar q0
+    tm.add_transition("q2", "0", "q2", "0", "L")  # Saltar
+    tm.add_transition("q2", "1", "q2", "1", "L")  # Saltar (por completitud)
+    tm.add_transition("q2", "X", "q2", "X", "L")  # Saltar
+    tm.add_transition("q2", "Y", "q2", "Y", "L")  # Saltar
+
+    # q3: verificar sin símbolos no marcados (solo X/Y permitidos)
+    tm.add_transition("q3", "X", "q3", "X", "R")  # Saltar X
+    tm.add_transition("q3", "Y", "q3", "Y", "R")  # Saltar Y
+    tm.add_transition("q3", "0", "q_reject", "0", "N")  # 0 extra: rechazar
+    tm.add_transition("q3", "1", "q_reject", "1", "N")  # 1 extra: rechazar
+    tm.add_transition("q3", "_", "q_accept", "_", "N")  # Todo marcado correctamente: aceptar
+
+    try:
+        tm._c_lib = compile_to_c(tm)
+    except (OSError, subprocess.SubprocessError):
+        tm.compile()  # Sin gcc: el bucle especializado en Python
+
+    return tm
+
+
+def main():
+    tm = create_on1n_machine()
+    print("Simulador de MT para {0^n 1^n} estricta.")
+    input_str = input("Ingresa la cadena de entrada (ej. 0101): ").strip()
+    tm.load_input(input_str)
+
+    mode = input("Modo: 'auto' o 'step' (paso a paso)? ").strip().lower()
+    step_by_step = mode == 'step'
+    burst = 1
+    if step_by_step:
+        answer = input("Pasos a mostrar entre pausas (Enter = 1): ").strip()
+        if answer:
+            try:
+                burst = int(answer)
+            except ValueError:
+                burst = 0
+            if burst < 1:
+                print(f"Valor no válido: {answer!r}; se usa 1.")
+                burst = 1
+
+    result, _ = tm.run(step_by_step=step_by_step, max_steps=10000, burst=burst)
+    print(f"\nResultado: {result.upper()}")
+    if result == 'loop':
+        print("Se detectó un bucle (configuración repetida o límite de pasos alcanzado).")
+    print(f"Pasos totales: {tm.steps}")
+    final_config = tm.get_config()
+    print("Configuración final:")
+    print(f"Estado: {final_config['estado']}")
+    print(f"Cinta: {final_config['cinta']}")
+    print(f"Cabezal: {final_config['cabezal']}")
+
+
+# Pruebas unitarias básicas
+if __name__ == "__main__":
+    print("=== PRUEBAS ===")
+    tm = create_on1n_machine()
+
+    tests = [
+        ("", "accept"),       # n=0
+        ("01", "accept"),     # n=1
+        ("0011", "accept"),   # n=2
+        ("001", "reject"),    # Más 0s que 1s
+        ("1100", "reject"),   # Orden invertido (1s antes)
+        ("0101", "reject")    # Intercalado (igual conteo pero orden malo)
+    ]
+
+    for inp, expected in tests:
+        tm.load_input(inp)
+        result, _ = tm.run(step_by_step=False, max_steps=1000)
+        status = "OK" if result == expected else "FAIL"
+        print(f"Entrada '{inp}': {result} (esperado: {expected}) - {status}")
+
+    # Historial registrado: una configuración por transición más la final
+    tm.load_input("0011")
+    result, _ = tm.run(max_steps=1000, record=True)
+    configs = list(tm.get_history_dicts())
+    ok = len(configs) == tm.steps + 1 and configs[-1] == tm.get_config()
+    print(f"Historial '0011': {len(configs)} configuraciones - {'OK' if ok else 'FAIL'}")
+
+    # Bucle q0 --_/_,N--> q0: la configuración se repite enseguida, con el
+    # backend que elija run() y con el bucle que registra el historial
+    loop_tm = TuringMachine(["q0", "q_accept", "q_reject"], ["0"], ["0", "_"], "q0", ["q_accept"])
+    loop_tm.add_transition("q0", "_", "q0", "_", "N")
+    for record in (False, True):
+        loop_tm.load_input("")
+        result, _ = loop_tm.run(max_steps=100000, record=record)
+        ok = result == "loop" and loop_tm.steps < 10
+        print(f"Bucle q0 (record={record}): {result} en {loop_tm.steps} pasos "
+              f"(esperado: loop) - {'OK' if ok else 'FAIL'}")
+
+    # Barridos de compile(): el bucle especializado corta la racha en
+    # max_steps y traslada las celdas entre pilas igual que step() paso a paso
+    fast_tm = create_on1n_machine()
+    fast_tm._c_lib = None
+    fast_tm.compile()
+    ok = True
+    for max_steps in range(0, 3400, 7):
+        fast_tm.load_input("0" * 40 + "1" * 40)
+        result, _ = fast_tm.run(max_steps=max_steps)
+        fast = (result, fast_tm.steps, fast_tm.get_config())
+        fast_tm.load_input("0" * 40 + "1" * 40)
+        result, steps = 'continue', 0
+        while result == 'continue':
+            result = fast_tm.step() if steps < max_steps else 'loop'
+            steps += result == 'continue'
+        ok = ok and fast == (result, steps, fast_tm.get_config())
+    print(f"Barridos de compile() en '0^40 1^40': {'OK' if ok else 'FAIL'}")
+
+    # Todos los bucles disponibles (Python, historial, compile(), Numba,
+    # Cython y C) dan el mismo resultado, estado, pasos, cabezal y cinta:
+    # MT aleatorias (muchas con bucles), una que copia su entrada y luego
+    # oscila (amplía las pilas durante la detección de ciclos) y una que
+    # escribe hacia la derecha sin parar (amplía el buffer de C con _GROW)
+    import random
+    rng = random.Random(0)
+    tape_syms = ["0", "1", "X", "_"]
+    cases = []
+    for _ in range(40):
+        names = [f"q{i}" for i in range(rng.randint(1, 4))]
+        rand_tm = TuringMachine(names + ["q_accept", "q_reject"], ["0", "1"], tape_syms,
+                                "q0", ["q_accept"])
+        for state in names:
+            for sym in tape_syms:
+                if rng.random() < 0.9:
+                    next_state = rng.choice(names * 3 + ["q_accept", "q_reject"])
+                    rand_tm.add_transition(state, sym, next_state, rng.choice(tape_syms),
+                                           rng.choice("RLN"))
+        inputs = ["".join(rng.choice("01_") for _ in range(rng.randint(0, 12))) for _ in range(3)]
+        cases.append((rand_tm, inputs, (0, 7, 500)))
+    copy_tm = TuringMachine(["q0", "q1", "q2", "qb", "qc", "q_accept", "q_reject"], ["0"],
+                            tape_syms, "q0", ["q_accept"])
+    for trans in [("q0", "X", "q0", "X", "R"), ("q0", "0", "q1", "X", "R"),
+                  ("q0", "1", "qb", "1", "R"), ("q0", "_", "qb", "_", "R"),
+                  ("q1", "0", "q1", "0", "R"), ("q1", "1", "q1", "1", "R"),
+                  ("q1", "_", "q2", "1", "L"), ("q2", "0", "q2", "0", "L"),
+                  ("q2", "1", "q2", "1", "L"), ("q2", "X", "q0", "X", "R"),
+                  ("qb", "X", "qb", "X", "R"), ("qb", "1", "qb", "1", "R"),
+                  ("qb", "_", "qc", "_", "L"), ("qc", "1", "qc", "1", "L"),
+                  ("qc", "X", "qc", "X", "L"), ("qc", "_", "qb", "_", "R")]:
+        copy_tm.add_transition(*trans)
+    cases.append((copy_tm, ["0" * 100], (100000,)))
+    writer_tm = TuringMachine(["q0", "q_accept", "q_reject"], ["0"], ["0", "1", "_"],
+                              "q0", ["q_accept"])
+    writer_tm.add_transition("q0", "_", "q0", "1", "R")
+    cases.append((writer_tm, [""], (3000,)))
+
+    mismatches = 0
+    backend_names = set()
+    for case_tm, inputs, limits in cases:
+        case_tm.compile()
+        backends = [("python", case_tm._run_python),
+                    ("historial", lambda n: case_tm._run_traced(n, None, True)[0]),
+                    ("compile", case_tm._run_specialized)]
+        if _run_nb is not None:
+            backends.append(("numba", case_tm._run_numba))
+        if TuringMachineC is not None:
+            backends.append(("cython", case_tm._run_cython))
+        try:
+            case_tm._c_lib = compile_to_c(case_tm)
+            backends.append(("c", case_tm._run_c))
+        except (OSError, subprocess.SubprocessError):
+            pass
+        for inp in inputs:
+            for max_steps in limits:
+                outcomes = set()
+                for name, run_backend in backends:
+                    case_tm.load_input(inp)
+                    result = run_backend(max_steps)
+                    tape = case_tm.tape
+                    outcomes.add((result, case_tm.current_state, case_tm.steps, tape.head,
+                                  tape.current, bytes(tape.left.lstrip(b"\0")),
+                                  bytes(tape.right.lstrip(b"\0"))))
+                    backend_names.add(name)
+                mismatches += len(outcomes) != 1
+    ok = mismatches == 0
+    print(f"Backends ({', '.join(sorted(backend_names))}): {mismatches} discrepancias "
+          f"- {'OK' if ok else 'FAIL'}")
+
+    print("\nModo interactivo.")
     main()  # Descomenta para CLIK interactiva
\ No newline at end of file